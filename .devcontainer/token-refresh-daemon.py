@@ -20,6 +20,7 @@ Usage:
 import argparse
 import json
 import os
+import select
 import signal
 import subprocess
 import sys
@@ -33,37 +34,64 @@ REFRESH_THRESHOLD_HOURS = 2
 # Check interval in seconds (every 5 minutes)
 CHECK_INTERVAL_SECONDS = 300
 
+# Resolved once at import; the getters below return these
+_SCRIPT_DIR = Path(__file__).parent.resolve()
+_PROJECT_DIR = _SCRIPT_DIR.parent
+_CREDENTIALS_FILE = _SCRIPT_DIR / ".credentials" / "github_token.json"
+
+# (mtime_ns, expiry) of the last credentials file read by get_token_expiry
+_EXPIRY_CACHE: tuple[int, float | None] | None = None
+
 
 def get_script_dir() -> Path:
     """Get the directory containing this script."""
-    return Path(__file__).parent.resolve()
+    return _SCRIPT_DIR
 
 
 def get_project_dir() -> Path:
     """Get the project root directory."""
-    return get_script_dir().parent
+    return _PROJECT_DIR
 
 
 def get_credentials_file() -> Path:
     """Get the path to the credentials file."""
-    return get_script_dir() / ".credentials" / "github_token.json"
+    return _CREDENTIALS_FILE
+
+
+def get_token_expiry() -> float | None:
+    """Read the current token expiry time as a Unix timestamp.
 
+    The parsed value is cached against the credentials file's mtime, so the
+    file is only re-read after a refresh has rewritten it.
+    """
+    global _EXPIRY_CACHE
 
-def get_token_expiry() -> datetime | None:
-    """Read the current token expiry time."""
     creds_file = get_credentials_file()
-    if not creds_file.exists():
+    try:
+        mtime_ns = os.stat(creds_file).st_mtime_ns
+    except FileNotFoundError:
+        _EXPIRY_CACHE = None
         return None
 
+    if _EXPIRY_CACHE is not None and _EXPIRY_CACHE[0] == mtime_ns:
+        return _EXPIRY_CACHE[1]
+
+    expiry = None
     try:
         data = json.loads(creds_file.read_text())
         expires_at = data.get("expires_at")
         if expires_at:
-            return datetime.fromisoformat(expires_at.replace("Z", "+00:00"))
+            iso = expires_at.replace("Z", "+00:00")
+            expiry_dt = datetime.fromisoformat(iso)
+            # Read naive timestamps as UTC, not host local time
+            if expiry_dt.tzinfo is None:
+                expiry_dt = expiry_dt.replace(tzinfo=UTC)
+            expiry = expiry_dt.timestamp()
     except (json.JSONDecodeError, ValueError):
         pass
 
-    return None
+    _EXPIRY_CACHE = (mtime_ns, expiry)
+    return expiry
 
 
 def refresh_token() -> bool:
@@ -103,10 +131,10 @@ def should_refresh() -> bool:
     if expiry is None:
         return True
 
-    now = datetime.now(UTC)
-    remaining_hours = (expiry - now).total_seconds() / 3600
+    remaining_seconds = expiry - time.time()
 
-    if remaining_hours < REFRESH_THRESHOLD_HOURS:
+    if remaining_seconds < REFRESH_THRESHOLD_HOURS * 3600:
+        remaining_hours = remaining_seconds / 3600
         print(f"Token expires in {remaining_hours:.1f} hours, refreshing...")
         return True
 
@@ -120,7 +148,10 @@ def run_daemon() -> None:
     threshold = REFRESH_THRESHOLD_HOURS
     print(f"Check every {interval}s, refresh when < {threshold}h remain")
 
-    # Handle graceful shutdown
+    # Handle graceful shutdown. The handlers also write to a wakeup pipe, so
+    # a signal ends the select() below immediately rather than being polled
+    # for. This works on every POSIX host and leaves the signal mask alone,
+    # so child processes still receive SIGTERM/SIGINT normally.
     running = True
 
     def handle_signal(signum: int, frame: object) -> None:
@@ -128,6 +159,9 @@ def run_daemon() -> None:
         print(f"\nReceived signal {signum}, shutting down...")
         running = False
 
+    wakeup_read, wakeup_write = os.pipe()
+    os.set_blocking(wakeup_write, False)
+    signal.set_wakeup_fd(wakeup_write)
     signal.signal(signal.SIGTERM, handle_signal)
     signal.signal(signal.SIGINT, handle_signal)
 
@@ -138,48 +172,42 @@ def run_daemon() -> None:
         except Exception as e:
             print(f"Error in daemon loop: {e}", file=sys.stderr)
 
-        # Sleep in small increments to respond to signals quickly
-        for _ in range(CHECK_INTERVAL_SECONDS):
-            if not running:
-                break
-            time.sleep(1)
+        if running:
+            select.select([wakeup_read], [], [], CHECK_INTERVAL_SECONDS)
 
     print("Daemon stopped")
 
 
 def daemonize() -> None:
-    """Fork into background daemon process."""
-    # First fork
-    pid = os.fork()
-    if pid > 0:
-        print(f"Daemon started with PID {pid}")
-        sys.exit(0)
-
-    # Decouple from parent environment
-    os.chdir("/")
-    os.setsid()
-    os.umask(0)
-
-    # Second fork
-    pid = os.fork()
-    if pid > 0:
-        sys.exit(0)
-
-    # Redirect standard file descriptors
-    sys.stdout.flush()
-    sys.stderr.flush()
-
-    with open("/dev/null") as devnull:
-        os.dup2(devnull.fileno(), sys.stdin.fileno())
-
-    log_file = get_script_dir() / ".credentials" / "daemon.log"
-    log_file.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(log_file, "a") as log:
-        os.dup2(log.fileno(), sys.stdout.fileno())
-        os.dup2(log.fileno(), sys.stderr.fileno())
-
-    # Write PID file
+    """Start a detached daemon process and return immediately.
+
+    The daemon is a fresh interpreter running this script with
+    ``--daemon-child`` in a new session, rather than a fork of this process,
+    so it does not inherit the parent's heap.
+    """
+    credentials_dir = get_script_dir() / ".credentials"
+    credentials_dir.mkdir(parents=True, exist_ok=True)
+    log_file = credentials_dir / "daemon.log"
+
+    script = get_script_dir() / Path(__file__).name
+
+    with open(os.devnull) as devnull, open(log_file, "a") as log:
+        proc = subprocess.Popen(
+            [sys.executable, "-u", str(script), "--daemon-child"],
+            cwd="/",
+            stdin=devnull,
+            stdout=log,
+            stderr=log,
+            close_fds=True,
+            start_new_session=True,
+            umask=0,
+        )
+
+    print(f"Daemon started with PID {proc.pid}")
+
+
+def run_daemon_child() -> None:
+    """Entry point for the detached process started by daemonize()."""
     pid_file = get_script_dir() / ".credentials" / "daemon.pid"
     pid_file.write_text(str(os.getpid()))
 
@@ -201,6 +229,11 @@ def main() -> None:
         action="store_true",
         help="Refresh token immediately and exit",
     )
+    parser.add_argument(
+        "--daemon-child",
+        action="store_true",
+        help=argparse.SUPPRESS,
+    )
 
     args = parser.parse_args()
 
@@ -209,6 +242,8 @@ def main() -> None:
             print("Token refreshed successfully")
         else:
             sys.exit(1)
+    elif args.daemon_child:
+        run_daemon_child()
     elif args.daemon:
         daemonize()
     else:
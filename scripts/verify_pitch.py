@@ -3,10 +3,12 @@
 Verify the pitch of generated audio files matches their target frequencies.
 """
 
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import soundfile as sf
+from scipy import fft
 
 
 # Note frequencies for octave 4
@@ -40,9 +42,11 @@ def estimate_pitch_autocorr(audio: np.ndarray, sr: int) -> float:
     # Remove DC offset
     segment = segment - np.mean(segment)
 
-    # Autocorrelation
-    corr = np.correlate(segment, segment, mode='full')
-    corr = corr[len(corr) // 2:]  # Take positive lags only
+    # Autocorrelation via FFT, zero-padded so lags don't wrap around.
+    # Gives the same positive lags as np.correlate in O(n log n).
+    n = 1 << (2 * len(segment) - 1).bit_length()
+    spectrum = fft.rfft(segment, n)
+    corr = fft.irfft(spectrum * np.conj(spectrum), n)[:len(segment)]
 
     # Find first peak after initial decay
     # Skip the first few samples (very short periods = very high freq)
@@ -64,6 +68,14 @@ def estimate_pitch_autocorr(audio: np.ndarray, sr: int) -> float:
     return freq
 
 
+@lru_cache(maxsize=None)
+def hanning_window(size: int) -> np.ndarray:
+    """Hanning window of the given size, shared between calls."""
+    window = np.hanning(size)
+    window.flags.writeable = False
+    return window
+
+
 def estimate_pitch_fft(audio: np.ndarray, sr: int) -> float:
     """
     Estimate fundamental frequency using FFT.
@@ -81,13 +93,12 @@ def estimate_pitch_fft(audio: np.ndarray, sr: int) -> float:
     segment = audio[start:end]
 
     # Apply window function
-    window = np.hanning(len(segment))
-    segment = segment * window
+    segment = segment * hanning_window(len(segment))
 
     # FFT
-    fft = np.fft.rfft(segment)
-    freqs = np.fft.rfftfreq(len(segment), 1/sr)
-    magnitudes = np.abs(fft)
+    spectrum = fft.rfft(segment)
+    freqs = fft.rfftfreq(len(segment), 1/sr)
+    magnitudes = np.abs(spectrum)
 
     # Find peaks in reasonable frequency range (50-1000 Hz)
     valid_mask = (freqs >= 50) & (freqs <= 1000)